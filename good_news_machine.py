@@ -10,11 +10,11 @@ Usage:
     python good_news_machine.py
 
 Output:
-    - good_news.json: Array of detected good news stories
+    - good_news.json: Array of detected good news stories (UTF-8 encoded)
     - Console summary of findings
 
 Requirements:
-    pip install pandas scipy requests
+    pip install numba numpy orjson pandas pyarrow scipy requests
 
 Expanding to more indicators:
     1. Look at owid_data_sources.md for the full list of 50+ indicators
@@ -24,14 +24,22 @@ Expanding to more indicators:
 Author: Built for Hex-a-thon hackathon
 """
 
+import glob
+import hashlib
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
 import requests
+from numba import njit
 from scipy import stats
 
 # =============================================================================
@@ -56,6 +64,33 @@ MIN_R_SQUARED = 0.5
 # How recent must a milestone be to count as "news"? (years)
 MILESTONE_RECENCY_YEARS = 10
 
+# Maximum number of datasets to download at the same time
+MAX_DOWNLOAD_WORKERS = 16
+
+# Size of the chunks downloads are streamed to disk in (bytes)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Bump this when the analysis changes, so stories cached by older versions
+# are recomputed
+ANALYSIS_VERSION = 1
+
+# Column names OWID datasets use for the country and the year
+COUNTRY_COLUMNS = ["Entity", "Country", "country", "entity"]
+YEAR_COLUMNS = ["Year", "year", "date", "Date"]
+
+# Aggregate regions to drop so only countries remain
+# OWID includes things like "World", "Africa", "High income", etc.
+AGGREGATES = frozenset({
+    "World", "Africa", "Asia", "Europe", "North America", "South America",
+    "Oceania", "European Union", "High income", "Low income", "Middle income",
+    "Upper middle income", "Lower middle income", "OECD", "G20",
+    "Latin America and the Caribbean", "Sub-Saharan Africa",
+    "East Asia and Pacific", "Middle East and North Africa",
+    "South Asia", "Europe and Central Asia", "North America (WB)",
+    "African Union", "Americas (WHO)", "Eastern Mediterranean (WHO)",
+    "Europe (WHO)", "South-East Asia (WHO)", "Western Pacific (WHO)",
+})
+
 
 # =============================================================================
 # INDICATOR DEFINITIONS
@@ -207,6 +242,16 @@ class MilestoneResult:
 # DATA FETCHING
 # =============================================================================
 
+# Downloads run in parallel threads; this keeps their console lines intact
+print_lock = threading.Lock()
+
+
+def log(message: str):
+    """Print a message without interleaving output from other threads."""
+    with print_lock:
+        print(message)
+
+
 def ensure_data_dir():
     """Create data directory if it doesn't exist."""
     if not os.path.exists(DATA_DIR):
@@ -214,13 +259,108 @@ def ensure_data_dir():
         print(f"Created directory: {DATA_DIR}")
 
 
+def select_columns(columns: list[str], indicator: dict) -> list[str] | None:
+    """
+    Pick the columns clean_dataset needs (country, year and value) from a header.
+    
+    Returns:
+        List of column names, or None if no column matches the indicator's
+        value_column (in which case all columns should be kept, so that
+        clean_dataset can list them)
+    """
+    value_col = indicator["value_column"].lower()
+    if not any(value_col in col.lower() for col in columns):
+        return None
+    return [
+        col for col in columns
+        if col in COUNTRY_COLUMNS or col in YEAR_COLUMNS or value_col in col.lower()
+    ]
+
+
+def write_file_atomically(path: str, write):
+    """
+    Write a file through a temporary ".part" file that is renamed into place,
+    so an interrupted write never leaves a truncated file at path.
+    
+    Args:
+        path: Final file path
+        write: Function that writes the file's contents to the path it is given
+    """
+    partial_path = path + ".part"
+    try:
+        write(partial_path)
+        os.replace(partial_path, path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+
+def read_cached_csv(cache_path: str, parquet_path: str, indicator: dict) -> pd.DataFrame:
+    """
+    Parse a cached CSV and save a Parquet copy next to it.
+    
+    Only the columns the indicator needs are parsed, using the multithreaded
+    pyarrow CSV reader. Parquet keeps the parsed column types and loads much
+    faster than CSV, so later runs can skip CSV parsing entirely.
+    """
+    header = pd.read_csv(cache_path, nrows=0).columns
+    usecols = select_columns(list(header), indicator)
+    
+    # Columns are left untyped: clean_dataset coerces non-numeric cells to NaN
+    df = pd.read_csv(cache_path, usecols=usecols, engine="pyarrow")
+    write_file_atomically(parquet_path, lambda path: df.to_parquet(path, index=False))
+    return df
+
+
+def load_cached_dataset(cache_path: str, parquet_path: str, indicator: dict) -> pd.DataFrame:
+    """Load a cached dataset, preferring the Parquet copy over the raw CSV."""
+    if os.path.exists(parquet_path):
+        try:
+            df = pd.read_parquet(parquet_path)
+        except (OSError, pa.ArrowException) as e:
+            # Unreadable copy (e.g. from an older interrupted write): rebuild it
+            log(f"  NOTE: Rebuilding unreadable cache {parquet_path}: {e}")
+        else:
+            # The Parquet copy only has the columns needed when it was written, so
+            # re-read the CSV if the indicator's value_column has since changed
+            if select_columns(list(df.columns), indicator) is not None:
+                return df
+    return read_cached_csv(cache_path, parquet_path, indicator)
+
+
+def load_cache_meta(meta_path: str) -> dict:
+    """Load the saved HTTP validators (ETag / Last-Modified) for a cached dataset."""
+    if not os.path.exists(meta_path):
+        return {}
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache_meta(meta_path: str, response: requests.Response):
+    """Save the HTTP validators from a download so refreshes can be conditional."""
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+
+
 def download_dataset(indicator: dict, force_refresh: bool = False) -> pd.DataFrame:
     """
     Download a dataset from OWID, with local caching.
     
+    The raw CSV is cached in DATA_DIR along with a Parquet copy, which is
+    what gets loaded on later runs. On refresh, the request is conditional
+    on the cached ETag / Last-Modified, so unchanged datasets are not
+    downloaded again.
+    
     Args:
         indicator: Indicator config dictionary
-        force_refresh: If True, re-download even if cached
+        force_refresh: If True, re-download even if cached (unless unchanged)
         
     Returns:
         DataFrame with the dataset
@@ -228,26 +368,51 @@ def download_dataset(indicator: dict, force_refresh: bool = False) -> pd.DataFra
     ensure_data_dir()
     
     cache_path = os.path.join(DATA_DIR, f"{indicator['name']}.csv")
+    parquet_path = os.path.join(DATA_DIR, f"{indicator['name']}.parquet")
+    meta_path = os.path.join(DATA_DIR, f"{indicator['name']}.meta.json")
     
     # Use cached version if available and not forcing refresh
     if os.path.exists(cache_path) and not force_refresh:
-        print(f"  Loading cached: {indicator['name']}")
-        return pd.read_csv(cache_path)
+        log(f"  Loading cached: {indicator['name']}")
+        return load_cached_dataset(cache_path, parquet_path, indicator)
+    
+    # Only ask for the body if it changed since our cached copy
+    headers = {}
+    if os.path.exists(cache_path):
+        meta = load_cache_meta(meta_path)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
     
     # Download fresh
-    print(f"  Downloading: {indicator['name']}...")
+    log(f"  Downloading: {indicator['name']}...")
     try:
-        response = requests.get(indicator["url"], timeout=30)
-        response.raise_for_status()
-        
-        # Save to cache
-        with open(cache_path, "wb") as f:
-            f.write(response.content)
+        with requests.get(indicator["url"], headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                log(f"  Not modified, using cached: {indicator['name']}")
+                return load_cached_dataset(cache_path, parquet_path, indicator)
+            
+            response.raise_for_status()
+            
+            # Stream to cache in chunks instead of holding the whole file in memory.
+            # Write to a temporary file first so a failed download never leaves
+            # a truncated CSV in the cache.
+            partial_path = cache_path + ".part"
+            try:
+                with open(partial_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(partial_path, cache_path)
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+            save_cache_meta(meta_path, response)
         
-        return pd.read_csv(cache_path)
+        return read_cached_csv(cache_path, parquet_path, indicator)
     
     except requests.RequestException as e:
-        print(f"  ERROR downloading {indicator['name']}: {e}")
+        log(f"  ERROR downloading {indicator['name']}: {e}")
         return None
 
 
@@ -259,12 +424,19 @@ def load_all_datasets(force_refresh: bool = False) -> dict:
         Dict mapping indicator name to DataFrame
     """
     print("\n📥 Loading datasets...")
+    ensure_data_dir()
     datasets = {}
     
-    for indicator in INDICATORS:
-        df = download_dataset(indicator, force_refresh)
-        if df is not None:
-            datasets[indicator["name"]] = df
+    # Downloads are network-bound and independent, so fetch them concurrently
+    workers = max(1, min(MAX_DOWNLOAD_WORKERS, len(INDICATORS)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda indicator: (indicator["name"], download_dataset(indicator, force_refresh)),
+            INDICATORS,
+        )
+        for name, df in results:
+            if df is not None:
+                datasets[name] = df
     
     print(f"  Loaded {len(datasets)}/{len(INDICATORS)} datasets\n")
     return datasets
@@ -291,7 +463,7 @@ def clean_dataset(df: pd.DataFrame, indicator: dict) -> pd.DataFrame:
     
     # Find the country column (OWID uses "Entity" or "Country")
     country_col = None
-    for col in ["Entity", "Country", "country", "entity"]:
+    for col in COUNTRY_COLUMNS:
         if col in df.columns:
             country_col = col
             break
@@ -303,7 +475,7 @@ def clean_dataset(df: pd.DataFrame, indicator: dict) -> pd.DataFrame:
     
     # Find the year column
     year_col = None
-    for col in ["Year", "year", "date", "Date"]:
+    for col in YEAR_COLUMNS:
         if col in df.columns:
             year_col = col
             break
@@ -339,119 +511,149 @@ def clean_dataset(df: pd.DataFrame, indicator: dict) -> pd.DataFrame:
     # Remove rows with missing data
     clean_df = clean_df.dropna()
     
-    # Remove aggregate regions (keep only countries)
-    # OWID includes things like "World", "Africa", "High income", etc.
-    aggregates = [
-        "World", "Africa", "Asia", "Europe", "North America", "South America",
-        "Oceania", "European Union", "High income", "Low income", "Middle income",
-        "Upper middle income", "Lower middle income", "OECD", "G20",
-        "Latin America and the Caribbean", "Sub-Saharan Africa",
-        "East Asia and Pacific", "Middle East and North Africa",
-        "South Asia", "Europe and Central Asia", "North America (WB)",
-        "African Union", "Americas (WHO)", "Eastern Mediterranean (WHO)",
-        "Europe (WHO)", "South-East Asia (WHO)", "Western Pacific (WHO)",
-    ]
-    clean_df = clean_df[~clean_df["country"].isin(aggregates)]
+    # Use compact dtypes: every later pass over these columns reads less memory,
+    # and grouping/comparing countries works on integer category codes
+    clean_df = clean_df.astype({"country": "category", "year": "int16", "value": "float32"})
+    
+    # Remove aggregate regions (keep only countries), comparing category codes
+    # rather than country name strings
+    countries = clean_df["country"].cat
+    aggregate_codes = np.flatnonzero(countries.categories.isin(AGGREGATES))
+    clean_df = clean_df[~countries.codes.isin(aggregate_codes)]
     
     # Sort by country and year
     clean_df = clean_df.sort_values(["country", "year"]).reset_index(drop=True)
+    clean_df["country"] = clean_df["country"].cat.remove_unused_categories()
     
     return clean_df
 
 
+def country_ranges(df: pd.DataFrame) -> tuple[pd.Index, np.ndarray, np.ndarray]:
+    """
+    Find the block of rows belonging to each country in a cleaned DataFrame.
+    
+    clean_dataset sorts rows by country, so each country's rows are contiguous
+    and can be sliced directly instead of grouped.
+    
+    Args:
+        df: Cleaned DataFrame (sorted by country and year)
+        
+    Returns:
+        (countries, starts, ends): country k occupies rows starts[k]:ends[k]
+    """
+    codes = df["country"].cat.codes.to_numpy()
+    
+    # Trend and milestone detection rely on clean_dataset's (country, year)
+    # sort order instead of re-sorting each country
+    country_steps = np.diff(codes)
+    year_steps = np.diff(df["year"].to_numpy())
+    assert (country_steps >= 0).all() and ((country_steps > 0) | (year_steps >= 0)).all(), (
+        "rows must be sorted by country and year (see clean_dataset)"
+    )
+    
+    starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    ends = np.flatnonzero(np.diff(codes, append=-1)) + 1
+    countries = df["country"].cat.categories[codes[starts]]
+    return countries, starts, ends
+
+
 # =============================================================================
 # TREND DETECTION
 # =============================================================================
 
-def detect_trend(country_data: pd.DataFrame, indicator: dict) -> TrendResult | None:
+def find_all_trends(
+    df: pd.DataFrame, indicator: dict, ranges: tuple | None = None
+) -> list[TrendResult]:
     """
-    Detect if a country shows a statistically significant improving trend.
+    Find all countries with significant improving trends for an indicator.
     
-    Uses linear regression over the most recent data period.
+    Fits an ordinary least squares line to each country's most recent
+    MIN_YEARS_FOR_TREND data points. All countries are fitted at once from
+    per-country sums, which gives the same slope, r-squared and p-value as
+    running scipy's linregress country by country.
     
     Args:
-        country_data: DataFrame with year and value columns for one country
+        df: Cleaned DataFrame for the indicator (sorted by country and year)
         indicator: Indicator config dictionary
+        ranges: country_ranges(df), if already computed
         
     Returns:
-        TrendResult if significant trend found, None otherwise
+        List of TrendResult objects
     """
-    if len(country_data) < MIN_YEARS_FOR_TREND:
-        return None
-    
-    # Use most recent contiguous data
-    country_data = country_data.sort_values("year")
-    
-    # Get recent window (last N years of available data)
-    recent = country_data.tail(MIN_YEARS_FOR_TREND)
-    
-    years = recent["year"].values
-    values = recent["value"].values
-    
-    # Perform linear regression
-    slope, intercept, r_value, p_value, std_err = stats.linregress(years, values)
-    r_squared = r_value ** 2
+    countries, starts, ends = ranges if ranges is not None else country_ranges(df)
+    years = df["year"].to_numpy(dtype=np.float64)
+    values = df["value"].to_numpy(dtype=np.float64)
+    
+    # Get recent window (last N years of available data) for every country
+    first = np.maximum(starts, ends - MIN_YEARS_FOR_TREND)
+    last = ends - 1
+    codes = np.repeat(np.arange(len(countries)), ends - starts)
+    window = np.flatnonzero(np.arange(len(df)) >= first[codes])
+    codes = codes[window]
+    x = years[window]
+    y = values[window]
+    
+    # Per-country sums (centered on each country's mean for numerical stability)
+    n = ends - first
+    x_mean = np.bincount(codes, weights=x) / n
+    y_mean = np.bincount(codes, weights=y) / n
+    dx = x - x_mean[codes]
+    dy = y - y_mean[codes]
+    sxx = np.bincount(codes, weights=dx * dx)
+    sxy = np.bincount(codes, weights=dx * dy)
+    syy = np.bincount(codes, weights=dy * dy)
+    
+    # Linear regression: slope and r-squared
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        r_squared = np.clip(sxy * sxy / (sxx * syy), 0.0, 1.0)
     
     # Determine if trend is improving
-    good_direction = indicator["good_direction"]
-    if good_direction == "down":
+    if indicator["good_direction"] == "down":
         is_improving = slope < 0
     else:  # up
         is_improving = slope > 0
     
-    # Check statistical significance
-    if p_value > P_VALUE_THRESHOLD:
-        return None  # Not statistically significant
-    
-    if r_squared < MIN_R_SQUARED:
-        return None  # Trend not strong enough
+    # Candidates: enough data and a strong trend in the good direction
+    candidates = np.flatnonzero(
+        (n >= MIN_YEARS_FOR_TREND) & (r_squared >= MIN_R_SQUARED) & is_improving
+    )
     
-    if not is_improving:
-        return None  # Trend is in wrong direction (not good news)
+    # Two-sided p-value of the slope, in one batched t-distribution call
+    dof = n[candidates] - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std_err = np.sqrt((1 - r_squared[candidates]) * syy[candidates] / sxx[candidates] / dof)
+        t_stat = slope[candidates] / std_err
+    p_value = np.full(len(countries), np.nan)
+    p_value[candidates] = 2 * stats.t.sf(np.abs(t_stat), dof)
     
-    # Calculate percent change
-    start_value = values[0]
-    end_value = values[-1]
-    if start_value != 0:
-        percent_change = ((end_value - start_value) / abs(start_value)) * 100
-    else:
-        percent_change = 0
-    
-    return TrendResult(
-        country=country_data["country"].iloc[0],
-        indicator=indicator["name"],
-        display_name=indicator["display_name"],
-        direction="improving",
-        slope=slope,
-        p_value=p_value,
-        r_squared=r_squared,
-        start_year=int(years[0]),
-        end_year=int(years[-1]),
-        start_value=start_value,
-        end_value=end_value,
-        percent_change=percent_change,
-        unit=indicator["unit"],
-    )
-
-
-def find_all_trends(df: pd.DataFrame, indicator: dict) -> list[TrendResult]:
-    """
-    Find all countries with significant improving trends for an indicator.
+    # Keep only statistically significant trends
+    keep = candidates[p_value[candidates] <= P_VALUE_THRESHOLD]
     
-    Args:
-        df: Cleaned DataFrame for the indicator
-        indicator: Indicator config dictionary
-        
-    Returns:
-        List of TrendResult objects
-    """
     results = []
-    
-    for country in df["country"].unique():
-        country_data = df[df["country"] == country]
-        trend = detect_trend(country_data, indicator)
-        if trend is not None:
-            results.append(trend)
+    for i in keep:
+        start_value = float(values[first[i]])
+        end_value = float(values[last[i]])
+        if start_value != 0:
+            percent_change = ((end_value - start_value) / abs(start_value)) * 100
+        else:
+            percent_change = 0
+        
+        results.append(TrendResult(
+            country=countries[i],
+            indicator=indicator["name"],
+            display_name=indicator["display_name"],
+            direction="improving",
+            slope=float(slope[i]),
+            p_value=float(p_value[i]),
+            r_squared=float(r_squared[i]),
+            start_year=int(years[first[i]]),
+            end_year=int(years[last[i]]),
+            start_value=start_value,
+            end_value=end_value,
+            percent_change=percent_change,
+            unit=indicator["unit"],
+        ))
     
     # Sort by strength of improvement (percent change)
     results.sort(key=lambda x: abs(x.percent_change), reverse=True)
@@ -463,86 +665,122 @@ def find_all_trends(df: pd.DataFrame, indicator: dict) -> list[TrendResult]:
 # MILESTONE DETECTION
 # =============================================================================
 
-def detect_milestones(country_data: pd.DataFrame, indicator: dict) -> list[MilestoneResult]:
+@njit(cache=True)
+def first_crossings(
+    values: np.ndarray, milestones: tuple[float, ...], direction_up: bool
+) -> np.ndarray:
+    """
+    Find the first data point at which each milestone was crossed.
+    
+    Compiled with numba, so the scan over every (previous, current) pair of
+    data points runs as a native loop. Milestones are passed as a tuple, so
+    numba compiles a version for each milestone count with the milestone
+    loop length fixed at compile time.
+    
+    Args:
+        values: One country's values, sorted by year
+        milestones: Milestone thresholds (as floats)
+        direction_up: True if crossing means rising above the milestone,
+            False if it means falling below it
+        
+    Returns:
+        For each milestone, the index of the first value past it (-1 if never crossed)
+    """
+    crossings = np.full(len(milestones), -1, dtype=np.int64)
+    
+    for m in range(len(milestones)):
+        milestone = milestones[m]
+        for i in range(1, len(values)):
+            if direction_up:
+                # Good news = value went above milestone
+                crossed = values[i - 1] <= milestone and values[i] > milestone
+            else:
+                # Good news = value went below milestone
+                crossed = values[i - 1] >= milestone and values[i] < milestone
+            if crossed:
+                crossings[m] = i
+                break  # Only count first crossing of each milestone
+    
+    return crossings
+
+
+def detect_milestones(
+    country: str, years: np.ndarray, values: np.ndarray, indicator: dict
+) -> list[MilestoneResult]:
     """
     Detect if a country has crossed any milestone thresholds.
     
     Args:
-        country_data: DataFrame with year and value columns for one country
+        country: Country name
+        years: The country's years, sorted (as produced by clean_dataset)
+        values: The country's values, in the same order as years
         indicator: Indicator config dictionary
         
     Returns:
         List of MilestoneResult objects for milestones crossed
     """
     results = []
-    country = country_data["country"].iloc[0]
-    country_data = country_data.sort_values("year")
-    
-    good_direction = indicator["good_direction"]
     current_year = datetime.now().year
     
-    for milestone in indicator["milestones"]:
-        # Find when this milestone was crossed
-        for i in range(1, len(country_data)):
-            prev_row = country_data.iloc[i - 1]
-            curr_row = country_data.iloc[i]
-            
-            prev_value = prev_row["value"]
-            curr_value = curr_row["value"]
-            year = int(curr_row["year"])
-            
-            # Check if milestone was crossed in the right direction
-            crossed = False
-            if good_direction == "down":
-                # Good news = value went below milestone
-                if prev_value >= milestone > curr_value:
-                    crossed = True
-            else:  # up
-                # Good news = value went above milestone
-                if prev_value <= milestone < curr_value:
-                    crossed = True
+    if not indicator["milestones"]:
+        return results
+    
+    crossings = first_crossings(
+        values,
+        tuple(float(milestone) for milestone in indicator["milestones"]),
+        indicator["good_direction"] == "up",
+    )
+    
+    for milestone, i in zip(indicator["milestones"], crossings):
+        if i < 0:
+            continue
+        
+        year = int(years[i])
+        
+        # Check if recent enough to be "news"
+        if current_year - year <= MILESTONE_RECENCY_YEARS:
+            headline_template = indicator["milestone_templates"].get(
+                milestone, 
+                f"{{country}} crossed {milestone} {indicator['unit']} milestone"
+            )
+            headline = headline_template.format(country=country)
             
-            if crossed:
-                # Check if recent enough to be "news"
-                if current_year - year <= MILESTONE_RECENCY_YEARS:
-                    headline_template = indicator["milestone_templates"].get(
-                        milestone, 
-                        f"{{country}} crossed {milestone} {indicator['unit']} milestone"
-                    )
-                    headline = headline_template.format(country=country)
-                    
-                    results.append(MilestoneResult(
-                        country=country,
-                        indicator=indicator["name"],
-                        display_name=indicator["display_name"],
-                        milestone_value=milestone,
-                        crossed_year=year,
-                        headline=headline,
-                        previous_value=prev_value,
-                        new_value=curr_value,
-                        unit=indicator["unit"],
-                    ))
-                break  # Only count first crossing of each milestone
+            results.append(MilestoneResult(
+                country=country,
+                indicator=indicator["name"],
+                display_name=indicator["display_name"],
+                milestone_value=milestone,
+                crossed_year=year,
+                headline=headline,
+                previous_value=float(values[i - 1]),
+                new_value=float(values[i]),
+                unit=indicator["unit"],
+            ))
     
     return results
 
 
-def find_all_milestones(df: pd.DataFrame, indicator: dict) -> list[MilestoneResult]:
+def find_all_milestones(
+    df: pd.DataFrame, indicator: dict, ranges: tuple | None = None
+) -> list[MilestoneResult]:
     """
     Find all recent milestone crossings for an indicator.
     
     Args:
-        df: Cleaned DataFrame for the indicator
+        df: Cleaned DataFrame for the indicator (sorted by country and year)
         indicator: Indicator config dictionary
+        ranges: country_ranges(df), if already computed
         
     Returns:
         List of MilestoneResult objects
     """
     results = []
+    countries, starts, ends = ranges if ranges is not None else country_ranges(df)
+    years = df["year"].to_numpy()
+    values = df["value"].to_numpy()
     
-    for country in df["country"].unique():
-        country_data = df[df["country"] == country]
-        milestones = detect_milestones(country_data, indicator)
+    for country, start, end in zip(countries, starts, ends):
+        milestones = detect_milestones(country, years[start:end], values[start:end], indicator)
         results.extend(milestones)
     
     # Sort by recency
@@ -622,6 +860,89 @@ def milestone_to_story(milestone: MilestoneResult) -> dict:
 # MAIN PIPELINE
 # =============================================================================
 
+def stories_cache_path(indicator: dict) -> str:
+    """
+    Path where an indicator's stories are cached between runs.
+    
+    The file name includes a hash of the downloaded CSV, the indicator config
+    and the analysis settings, so any change to them means a fresh analysis.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    with open(os.path.join(DATA_DIR, f"{indicator['name']}.csv"), "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    
+    settings = {
+        "version": ANALYSIS_VERSION,
+        "indicator": indicator,
+        "min_years_for_trend": MIN_YEARS_FOR_TREND,
+        "p_value_threshold": P_VALUE_THRESHOLD,
+        "min_r_squared": MIN_R_SQUARED,
+        "milestone_recency_years": MILESTONE_RECENCY_YEARS,
+        # Which milestones are recent enough to be news depends on the year
+        "current_year": datetime.now().year,
+        "aggregates": sorted(AGGREGATES),
+    }
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+    
+    return os.path.join(DATA_DIR, f"{indicator['name']}.{digest.hexdigest()}.stories.json")
+
+
+def save_stories_cache(stories_path: str, indicator: dict, stories: list[dict]):
+    """Cache an indicator's stories, replacing any older cached analysis."""
+    for old_path in glob.glob(os.path.join(DATA_DIR, f"{indicator['name']}.*.stories.json")):
+        os.remove(old_path)
+    data = orjson.dumps(stories)
+    
+    def write(path: str):
+        with open(path, "wb") as f:
+            f.write(data)
+    
+    write_file_atomically(stories_path, write)
+
+
+def load_stories_cache(stories_path: str) -> list[dict] | None:
+    """
+    Load an indicator's cached stories.
+    
+    Returns:
+        List of story dicts, or None if there is no usable cache (an
+        unreadable file is removed so the analysis is recomputed)
+    """
+    if not os.path.exists(stories_path):
+        return None
+    try:
+        with open(stories_path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"  NOTE: Ignoring unreadable cached analysis {stories_path}: {e}")
+        os.remove(stories_path)
+        return None
+
+
+def analyze_indicator(
+    df: pd.DataFrame, indicator: dict
+) -> tuple[list[TrendResult], list[MilestoneResult]]:
+    """
+    Find trends and milestone crossings for one indicator.
+    
+    The dataset is split into per-country row ranges once and shared by
+    trend and milestone detection.
+    
+    Args:
+        df: Cleaned DataFrame for the indicator
+        indicator: Indicator config dictionary
+        
+    Returns:
+        (trends, milestones) lists
+    """
+    ranges = country_ranges(df)
+    trends = find_all_trends(df, indicator, ranges)
+    milestones = find_all_milestones(df, indicator, ranges)
+    return trends, milestones
+
+
 def run_analysis(force_refresh: bool = False) -> list[dict]:
     """
     Run the full Good News Machine analysis pipeline.
@@ -651,41 +972,58 @@ def run_analysis(force_refresh: bool = False) -> list[dict]:
         
         print(f"📊 Analyzing: {indicator['display_name']}")
         
+        # Reuse the stories from a previous run on the same data and settings
+        stories_path = stories_cache_path(indicator)
+        stories = load_stories_cache(stories_path)
+        if stories is not None:
+            print(f"  ♻️  Using cached analysis ({len(stories)} stories)")
+            all_stories.extend(stories)
+            print()
+            continue
+        
         # Clean the data
         df = clean_dataset(datasets[name], indicator)
         if df is None or len(df) == 0:
             print(f"  ⚠️  No valid data after cleaning")
             continue
         
-        print(f"  {len(df['country'].unique())} countries, {len(df)} data points")
+        print(f"  {len(df['country'].cat.categories)} countries, {len(df)} data points")
         
-        # Find trends
-        trends = find_all_trends(df, indicator)
+        # Find trends and milestones
+        trends, milestones = analyze_indicator(df, indicator)
         print(f"  ✅ Found {len(trends)} countries with improving trends")
-        
-        # Find milestones
-        milestones = find_all_milestones(df, indicator)
         print(f"  🎯 Found {len(milestones)} recent milestone crossings")
         
         # Convert to stories
+        stories = []
         for trend in trends[:20]:  # Top 20 per indicator
-            all_stories.append(trend_to_story(trend))
+            stories.append(trend_to_story(trend))
         
         for milestone in milestones:
-            all_stories.append(milestone_to_story(milestone))
+            stories.append(milestone_to_story(milestone))
+        
+        save_stories_cache(stories_path, indicator, stories)
+        all_stories.extend(stories)
         
         print()
     
-    # Sort all stories by year (most recent first)
-    all_stories.sort(key=lambda x: x["year"], reverse=True)
+    # Sort all stories by year (most recent first), keeping ties in order
+    years = np.fromiter((story["year"] for story in all_stories), dtype=np.int32, count=len(all_stories))
+    order = np.argsort(-years, kind="stable")
+    all_stories = [all_stories[i] for i in order]
     
     return all_stories
 
 
 def save_results(stories: list[dict]):
-    """Save results to JSON file."""
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(stories, f, indent=2)
+    """
+    Save results to JSON file.
+    
+    The file is UTF-8: non-ASCII characters (e.g. "Côte d'Ivoire") are
+    written as-is rather than as \\uXXXX escapes.
+    """
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(stories, option=orjson.OPT_INDENT_2))
     print(f"💾 Saved {len(stories)} stories to {OUTPUT_FILE}")
 
 
@@ -726,7 +1064,7 @@ if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="Good News Machine - Find positive trends in global development data")
-    parser.add_argument("--refresh", action="store_true", help="Force re-download of all datasets")
+    parser.add_argument("--refresh", action="store_true", help="Re-download datasets that changed since they were cached")
     args = parser.parse_args()
     
     # Run the analysis
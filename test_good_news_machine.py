@@ -0,0 +1,101 @@
+"""
+Regression checks for good_news_machine.py
+
+Run with:
+    pytest test_good_news_machine.py
+"""
+
+import good_news_machine as gnm
+
+
+LITERACY = next(i for i in gnm.INDICATORS if i["name"] == "literacy")
+
+
+def test_non_numeric_value_is_dropped_not_fatal(tmp_path, monkeypatch):
+    """A cell like "<1" in the value column must not break loading the dataset."""
+    monkeypatch.setattr(gnm, "DATA_DIR", str(tmp_path))
+    (tmp_path / "literacy.csv").write_text(
+        "Entity,Code,Year,Literacy rate\n"
+        "Chad,TCD,2000,40.5\n"
+        "Chad,TCD,2001,<1\n"
+        "Chad,TCD,2002,45.0\n"
+    )
+
+    # First load parses the CSV, second load reads the Parquet copy
+    for _ in range(2):
+        df = gnm.download_dataset(LITERACY)
+        clean_df = gnm.clean_dataset(df, LITERACY)
+        assert list(clean_df["year"]) == [2000, 2002]
+        assert list(clean_df["value"]) == [40.5, 45.0]
+
+
+def test_interrupted_download_leaves_no_partial_file(tmp_path, monkeypatch):
+    """A download that fails midway must not leave a .part file behind."""
+    monkeypatch.setattr(gnm, "DATA_DIR", str(tmp_path))
+
+    class InterruptedResponse:
+        status_code = 200
+        headers = {}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            yield b"Entity,Year,Literacy rate\n"
+            raise gnm.requests.exceptions.ChunkedEncodingError("connection dropped")
+
+    monkeypatch.setattr(gnm.requests, "get", lambda *args, **kwargs: InterruptedResponse())
+
+    assert gnm.download_dataset(LITERACY, force_refresh=True) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_truncated_parquet_copy_is_rebuilt(tmp_path, monkeypatch):
+    """A corrupt Parquet copy falls back to the CSV and is rewritten."""
+    monkeypatch.setattr(gnm, "DATA_DIR", str(tmp_path))
+    (tmp_path / "literacy.csv").write_text(
+        "Entity,Year,Literacy rate\n"
+        "Chad,2000,40.5\n"
+    )
+    (tmp_path / "literacy.parquet").write_bytes(b"PAR1 truncated")
+
+    df = gnm.download_dataset(LITERACY)
+    assert list(df["Literacy rate"]) == [40.5]
+
+    # The rebuilt copy is readable on the next run
+    df = gnm.download_dataset(LITERACY)
+    assert list(df["Literacy rate"]) == [40.5]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["literacy.csv", "literacy.parquet"]
+
+
+def test_truncated_stories_cache_is_a_miss(tmp_path, monkeypatch):
+    """A corrupt stories cache is removed and treated as missing."""
+    monkeypatch.setattr(gnm, "DATA_DIR", str(tmp_path))
+    stories_path = str(tmp_path / "literacy.abc.stories.json")
+    stories = [{"type": "milestone", "country": "Côte d'Ivoire", "year": 2020}]
+
+    gnm.save_stories_cache(stories_path, LITERACY, stories)
+    assert gnm.load_stories_cache(stories_path) == stories
+
+    with open(stories_path, "r+b") as f:
+        f.truncate(10)
+    assert gnm.load_stories_cache(stories_path) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_results_are_written_as_utf8(tmp_path, monkeypatch):
+    """good_news.json keeps non-ASCII country names as raw UTF-8."""
+    output_file = tmp_path / "good_news.json"
+    monkeypatch.setattr(gnm, "OUTPUT_FILE", str(output_file))
+
+    gnm.save_results([{"country": "Côte d'Ivoire", "year": 2020}])
+
+    text = output_file.read_text(encoding="utf-8")
+    assert "Côte d'Ivoire" in text
+    assert "\\u" not in text